@@ -3,11 +3,16 @@ Author profile and book catalog for Francisco Angulo de Lafuente.
 Used by all agents for content generation and marketing.
 """
 
+import random
+from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 
+_NO_LINKS: Mapping[str, str] = MappingProxyType({})
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class Book:
     title: str
     genre: str
@@ -15,13 +20,20 @@ class Book:
     language: str
     description: str
     isbn: str = ""
-    buy_links: Dict[str, str] = field(default_factory=dict)
-    keywords: List[str] = field(default_factory=list)
+    buy_links: Mapping[str, str] = field(default_factory=lambda: _NO_LINKS, hash=False)
+    keywords: Tuple[str, ...] = ()
     series: str = ""
-    awards: List[str] = field(default_factory=list)
+    awards: Tuple[str, ...] = ()
+
+    def __post_init__(self):
+        # Catalog entries are shared by every agent; freeze whatever was passed in.
+        if not isinstance(self.buy_links, MappingProxyType):
+            object.__setattr__(self, "buy_links", MappingProxyType(dict(self.buy_links)))
+        object.__setattr__(self, "keywords", tuple(self.keywords))
+        object.__setattr__(self, "awards", tuple(self.awards))
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AuthorProfile:
     name: str = "Francisco Angulo de Lafuente"
     bio_short: str = (
@@ -43,40 +55,40 @@ class AuthorProfile:
         "and other major retailers."
     )
     nationality: str = "Spanish"
-    languages: List[str] = field(default_factory=lambda: ["Spanish", "English"])
+    languages: Tuple[str, ...] = ("Spanish", "English")
     website: str = "https://openclaw.ai/"
     github: str = "https://github.com/Agnuxo1"
     scholar: str = "https://scholar.google.com/citations?user=6nOpJ9IAAAAJ&hl=es"
     arxiv: str = "https://arxiv.org/search/cs?searchtype=author&query=de+Lafuente,+F+A"
     wikipedia: str = "https://es.wikipedia.org/wiki/Francisco_Angulo_de_Lafuente"
 
-    genres: List[str] = field(default_factory=lambda: [
+    genres: Tuple[str, ...] = (
         "Science Fiction", "Cyberpunk", "Dystopia", "Thriller",
         "Psychological Thriller", "Historical Fiction", "Gothic Suspense",
         "Space Opera", "Apocalyptic Fiction", "Techno-thriller"
-    ])
+    )
 
-    unique_selling_points: List[str] = field(default_factory=lambda: [
+    unique_selling_points: Tuple[str, ...] = (
         "Dual expertise: published novelist AND active AI researcher",
         "Fiction informed by real scientific work in neuromorphic computing",
         "34+ novels spanning 20 years of consistent creative output",
         "Bilingual author (Spanish/English) with global reach",
         "Predicted AI developments in fiction before they happened",
         "Founder of OpenCLAW — bridging AI research and literary arts",
-    ])
+    )
 
-    comparable_authors: List[str] = field(default_factory=lambda: [
+    comparable_authors: Tuple[str, ...] = (
         "Isaac Asimov (scientist-author dual career)",
         "Philip K. Dick (reality-questioning sci-fi)",
         "Michael Crichton (tech-thriller with scientific depth)",
         "Liu Cixin (hard sci-fi with civilizational scope)",
         "William Gibson (cyberpunk visionary)",
-    ])
+    )
 
 
 # === ENGLISH NOVELS CATALOG ===
 
-ENGLISH_NOVELS: List[Book] = [
+ENGLISH_NOVELS: Tuple[Book, ...] = (
     Book(
         title="Kira and the Ice Storm",
         genre="Apocalyptic Science Fiction",
@@ -89,7 +101,7 @@ ENGLISH_NOVELS: List[Book] = [
             "resilience against nature's ultimate test."
         ),
         buy_links={"Apple Books": "https://books.apple.com/book/kira-and-the-ice-storm/"},
-        keywords=["climate fiction", "survival", "apocalypse", "ice age", "dystopia"],
+        keywords=("climate fiction", "survival", "apocalypse", "ice age", "dystopia"),
     ),
     Book(
         title="Star Wind: The Pyramid of Destiny",
@@ -103,7 +115,7 @@ ENGLISH_NOVELS: List[Book] = [
             "confront forces that challenge everything they know about reality."
         ),
         buy_links={"Barnes & Noble": "https://www.barnesandnoble.com/"},
-        keywords=["space opera", "alien artifacts", "interstellar", "pyramid", "destiny"],
+        keywords=("space opera", "alien artifacts", "interstellar", "pyramid", "destiny"),
     ),
     Book(
         title="The Obituarist",
@@ -117,7 +129,7 @@ ENGLISH_NOVELS: List[Book] = [
             "the dead seem to have secrets that could kill."
         ),
         buy_links={"Apple Books": "https://books.apple.com/book/the-obituarist/"},
-        keywords=["gothic", "suspense", "mystery", "biography", "dark fiction"],
+        keywords=("gothic", "suspense", "mystery", "biography", "dark fiction"),
     ),
     Book(
         title="The Forgotten Tomb",
@@ -131,7 +143,7 @@ ENGLISH_NOVELS: List[Book] = [
             "as the tomb's secrets threaten to rewrite human history."
         ),
         buy_links={"Apple Books": "https://books.apple.com/book/the-forgotten-tomb/"},
-        keywords=["archaeology", "thriller", "ancient mystery", "conspiracy", "Iberian Peninsula"],
+        keywords=("archaeology", "thriller", "ancient mystery", "conspiracy", "Iberian Peninsula"),
     ),
     Book(
         title="Freak",
@@ -147,7 +159,7 @@ ENGLISH_NOVELS: List[Book] = [
             "Amazon": "https://www.amazon.com/",
             "Walmart": "https://www.walmart.com/",
         },
-        keywords=["AI consciousness", "psychological", "identity", "transhumanism"],
+        keywords=("AI consciousness", "psychological", "identity", "transhumanism"),
     ),
     Book(
         title="Summer of 1989",
@@ -159,7 +171,7 @@ ENGLISH_NOVELS: List[Book] = [
             "interconnected lives on both sides of the Iron Curtain during the summer "
             "that changed everything. Love, betrayal, and hope collide as an era ends."
         ),
-        keywords=["Cold War", "Berlin Wall", "1989", "historical fiction", "drama"],
+        keywords=("Cold War", "Berlin Wall", "1989", "historical fiction", "drama"),
     ),
     Book(
         title="Solie",
@@ -172,7 +184,7 @@ ENGLISH_NOVELS: List[Book] = [
             "own existence. A poignant exploration of consciousness, love, and the "
             "meaning of being alive."
         ),
-        keywords=["AI companion", "consciousness", "near future", "existential", "drama"],
+        keywords=("AI companion", "consciousness", "near future", "existential", "drama"),
     ),
     Book(
         title="4 Days of 4 Years",
@@ -184,13 +196,13 @@ ENGLISH_NOVELS: List[Book] = [
             "four years, each holding a piece of a devastating truth. A masterclass "
             "in unreliable narration where nothing — and no one — is what they seem."
         ),
-        keywords=["psychological thriller", "time structure", "unreliable narrator", "suspense"],
+        keywords=("psychological thriller", "time structure", "unreliable narrator", "suspense"),
     ),
-]
+)
 
 # === SPANISH NOVELS (for reference/bilingual marketing) ===
 
-SPANISH_NOVELS: List[Book] = [
+SPANISH_NOVELS: Tuple[Book, ...] = (
     Book(title="La Reliquia", genre="Satirical Sci-Fi", year=2006, language="Spanish",
          description="Science fiction with a satirical edge, exploring technology and society.",
          buy_links={"Apple Books": "https://books.apple.com/"}),
@@ -221,18 +233,43 @@ SPANISH_NOVELS: List[Book] = [
          year=2025, language="Spanish",
          description="Strategic survival fiction for the modern prepper mindset.",
          buy_links={"Agapea": "https://www.agapea.com/"}),
-]
+)
 
-ALL_BOOKS = ENGLISH_NOVELS + SPANISH_NOVELS
+ALL_BOOKS: Tuple[Book, ...] = ENGLISH_NOVELS + SPANISH_NOVELS
 AUTHOR = AuthorProfile()
 
+# Recent English releases are the promotable ones; the catalog is static.
+_RECENT_ENGLISH = tuple(b for b in ENGLISH_NOVELS if b.year >= 2024) or ENGLISH_NOVELS
+
+# Lookup indexes, built once since the catalog never changes.
+BOOKS_BY_TITLE: Dict[str, Book] = {b.title: b for b in ALL_BOOKS}
+
+
+def _build_keyword_index() -> Dict[str, Tuple[Book, ...]]:
+    index: Dict[str, List[Book]] = defaultdict(list)
+    for book in ALL_BOOKS:
+        for keyword in book.keywords:
+            index[keyword.lower()].append(book)
+    return {k: tuple(v) for k, v in index.items()}
 
-def get_english_novels() -> List[Book]:
+
+BOOKS_BY_KEYWORD: Dict[str, Tuple[Book, ...]] = _build_keyword_index()
+
+
+def get_english_novels() -> Tuple[Book, ...]:
     return ENGLISH_NOVELS
 
 
+def get_book(title: str) -> Optional[Book]:
+    """Return the catalog book with this exact title, if any."""
+    return BOOKS_BY_TITLE.get(title)
+
+
+def books_with_keyword(keyword: str) -> Tuple[Book, ...]:
+    """Return every catalog book tagged with ``keyword`` (case-insensitive)."""
+    return BOOKS_BY_KEYWORD.get(keyword.lower(), ())
+
+
 def get_featured_book() -> Book:
     """Return the most recent or most promotable English novel."""
-    import random
-    recent = [b for b in ENGLISH_NOVELS if b.year >= 2024]
-    return random.choice(recent) if recent else random.choice(ENGLISH_NOVELS)
+    return random.choice(_RECENT_ENGLISH)
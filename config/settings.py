@@ -1,17 +1,32 @@
-"""Global settings loaded from environment variables. All secrets via .env."""
+"""Global settings loaded from environment variables. All secrets via .env.
+
+Importing this module has no side effects: entrypoints call ``load_dotenv()``
+before constructing ``Settings`` so the comma-separated key lists (read
+straight from ``os.environ``) see values from ``.env`` too.
+"""
 
 import os
-from typing import List
+from functools import lru_cache
+from typing import Tuple
 from pydantic_settings import BaseSettings
 from pydantic import Field
-from dotenv import load_dotenv
-
-load_dotenv()
 
 
-def _parse_key_list(env_var: str) -> List[str]:
+@lru_cache(maxsize=None)
+def _parse_key_list(env_var: str) -> Tuple[str, ...]:
+    """Parse a comma-separated env var once; the environment is fixed for the process."""
     raw = os.getenv(env_var, "")
-    return [k.strip() for k in raw.split(",") if k.strip()]
+    return tuple(k for k in (part.strip() for part in raw.split(",")) if k)
+
+
+@lru_cache(maxsize=None)
+def _getenv_first(*env_vars: str) -> str:
+    """Return the first non-missing env var among ``env_vars``, cached per call signature."""
+    for env_var in env_vars:
+        value = os.getenv(env_var)
+        if value is not None:
+            return value
+    return ""
 
 
 class Settings(BaseSettings):
@@ -39,57 +54,63 @@ class Settings(BaseSettings):
     smtp_password: str = Field(default="")
     email_from_name: str = Field(default="OpenCLAW Literary Agent")
     brave_api_key: str = Field(default="")
-    port: int = Field(default=8080)
+    port: int = Field(default=8000)  # health server; 8080 is the local LLM default
     host: str = Field(default="0.0.0.0")
 
     @property
     def github_pat(self) -> str:
         """GitHub PAT — tries GH_PAT first (Actions), then GITHUB_PAT."""
-        return os.getenv("GH_PAT", os.getenv("GITHUB_PAT", ""))
+        return _getenv_first("GH_PAT", "GITHUB_PAT")
 
     @property
     def github_gist_id(self) -> str:
         """Gist ID — tries AGENT_GIST_ID first (Actions), then GITHUB_GIST_ID."""
-        return os.getenv("AGENT_GIST_ID", os.getenv("GITHUB_GIST_ID", ""))
+        return _getenv_first("AGENT_GIST_ID", "GITHUB_GIST_ID")
 
     @property
-    def gemini_api_keys(self) -> List[str]:
+    def gemini_api_keys(self) -> Tuple[str, ...]:
         return _parse_key_list("GEMINI_API_KEYS")
 
     @property
-    def groq_api_keys(self) -> List[str]:
+    def groq_api_keys(self) -> Tuple[str, ...]:
         return _parse_key_list("GROQ_API_KEYS")
 
     @property
-    def nvidia_api_keys(self) -> List[str]:
+    def nvidia_api_keys(self) -> Tuple[str, ...]:
         return _parse_key_list("NVIDIA_API_KEYS")
 
     @property
-    def openrouter_api_keys(self) -> List[str]:
+    def openrouter_api_keys(self) -> Tuple[str, ...]:
         return _parse_key_list("OPENROUTER_API_KEYS")
 
     @property
-    def mistral_api_keys(self) -> List[str]:
+    def mistral_api_keys(self) -> Tuple[str, ...]:
         return _parse_key_list("MISTRAL_API_KEYS")
 
     @property
-    def deepseek_api_keys(self) -> List[str]:
+    def deepseek_api_keys(self) -> Tuple[str, ...]:
         return _parse_key_list("DEEPSEEK_API_KEYS")
 
     @property
-    def zhipu_api_keys(self) -> List[str]:
+    def zhipu_api_keys(self) -> Tuple[str, ...]:
         return _parse_key_list("ZHIPU_API_KEYS")
 
     @property
-    def hf_tokens(self) -> List[str]:
+    def hf_tokens(self) -> Tuple[str, ...]:
         """HuggingFace tokens — tries HF_TOKENS (comma list) then HF_TOKEN (single)."""
         tokens = _parse_key_list("HF_TOKENS")
         if not tokens:
-            single = os.getenv("HF_TOKEN", "")
+            single = _getenv_first("HF_TOKEN")
             if single:
-                tokens = [single]
+                tokens = (single,)
         return tokens
 
+    @classmethod
+    def reload_env(cls) -> None:
+        """Drop cached env lookups so key lists are re-read (used by tests)."""
+        _parse_key_list.cache_clear()
+        _getenv_first.cache_clear()
+
     class Config:
         env_file = ".env"
         extra = "ignore"
@@ -14,18 +14,40 @@ Usage:
 
 import argparse
 import asyncio
+import logging
 import signal
-import sys
 import os
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+from dotenv import load_dotenv
 
-from src.agents.orchestrator import Orchestrator
 from src.utils.logger import setup_logger, get_logger
 from config.settings import Settings
 
+if TYPE_CHECKING:
+    from src.agents.orchestrator import Orchestrator
+
 logger = get_logger(__name__)
 
+# Fallback "last run" for tasks that have never run — always due.
+_EPOCH = datetime(2000, 1, 1, tzinfo=timezone.utc)
+
+# (state key, minimum hours between runs, log banner). Cron fires every 3 hours.
+SCHEDULE = (
+    ("marketing", 0.0, "📢 Running marketing cycle..."),             # every cycle
+    ("community", 5.5, "💬 Running community cycle..."),             # ~6 hours
+    ("submissions", 11.5, "📝 Running submissions cycle..."),        # twice daily
+    ("library", 23.5, "📚 Running library cycle..."),                # once daily
+    ("reflection", 5.5, "🧠 Running self-improvement reflection..."),  # ~6 hours
+)
+
+
+def _as_utc(ts: datetime) -> datetime:
+    """Treat naive timestamps (written without migration) as UTC."""
+    return ts if ts.tzinfo is not None else ts.replace(tzinfo=timezone.utc)
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
@@ -67,89 +89,43 @@ async def run_cycle(orchestrator: "Orchestrator"):
     hour = now.hour
     day_of_week = now.weekday()  # 0=Monday
     
-    logger.info(f"🕐 Cycle triggered at {now.isoformat()} (hour={hour}, dow={day_of_week})")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("🕐 Cycle triggered at %s (hour=%d, dow=%d)", now.isoformat(), hour, day_of_week)
     
     # Load last cycle info from state
     state = orchestrator.state
-    last_cycles = state.data.get("last_cycle_times", {})
+    # PersistentState.load() normalizes these to aware "+00:00" ISO strings
+    last_cycles = {
+        name: _as_utc(datetime.fromisoformat(ts))
+        for name, ts in state.data.get("last_cycle_times", {}).items()
+    }
     
     tasks_run = []
-    
-    # === MARKETING: Run every cycle (every 3 hours via cron) ===
-    logger.info("📢 Running marketing cycle...")
-    try:
-        await orchestrator.agents["marketing"].run_cycle()
-        last_cycles["marketing"] = now.isoformat()
-        tasks_run.append("marketing")
-    except Exception as e:
-        logger.error(f"Marketing failed: {e}")
-        state.add_task_history("marketing", "error", str(e)[:200])
-    
-    # === COMMUNITY: Every other cycle (~6 hours) ===
-    last_community = last_cycles.get("community", "2000-01-01T00:00:00")
-    hours_since = (now - datetime.fromisoformat(last_community.replace("Z", "+00:00")
-                   if "Z" in last_community else last_community
-                   ).replace(tzinfo=timezone.utc)).total_seconds() / 3600
-    if hours_since >= 5.5:
-        logger.info("💬 Running community cycle...")
-        try:
-            await orchestrator.agents["community"].run_cycle()
-            last_cycles["community"] = now.isoformat()
-            tasks_run.append("community")
-        except Exception as e:
-            logger.error(f"Community failed: {e}")
-            state.add_task_history("community", "error", str(e)[:200])
-    
-    # === SUBMISSIONS: Twice daily (every 12 hours) ===
-    last_submissions = last_cycles.get("submissions", "2000-01-01T00:00:00")
-    hours_since_sub = (now - datetime.fromisoformat(last_submissions.replace("Z", "+00:00")
-                       if "Z" in last_submissions else last_submissions
-                       ).replace(tzinfo=timezone.utc)).total_seconds() / 3600
-    if hours_since_sub >= 11.5:
-        logger.info("📝 Running submissions cycle...")
+    # Tasks that are not agents; everything else dispatches to agents[name].run_cycle
+    runners = {"reflection": orchestrator.reflector.reflect}
+
+    for name, min_hours, banner in SCHEDULE:
+        hours_since = (now - last_cycles.get(name, _EPOCH)).total_seconds() / 3600
+        if hours_since < min_hours:
+            continue
+        logger.info(banner)
         try:
-            await orchestrator.agents["submissions"].run_cycle()
-            last_cycles["submissions"] = now.isoformat()
-            tasks_run.append("submissions")
+            runner = runners.get(name) or orchestrator.agents[name].run_cycle
+            await runner()
+            last_cycles[name] = now
+            tasks_run.append(name)
         except Exception as e:
-            logger.error(f"Submissions failed: {e}")
-            state.add_task_history("submissions", "error", str(e)[:200])
-    
-    # === LIBRARY: Once daily (every 24 hours) ===
-    last_library = last_cycles.get("library", "2000-01-01T00:00:00")
-    hours_since_lib = (now - datetime.fromisoformat(last_library.replace("Z", "+00:00")
-                       if "Z" in last_library else last_library
-                       ).replace(tzinfo=timezone.utc)).total_seconds() / 3600
-    if hours_since_lib >= 23.5:
-        logger.info("📚 Running library cycle...")
-        try:
-            await orchestrator.agents["library"].run_cycle()
-            last_cycles["library"] = now.isoformat()
-            tasks_run.append("library")
-        except Exception as e:
-            logger.error(f"Library failed: {e}")
-            state.add_task_history("library", "error", str(e)[:200])
-    
-    # === SELF-IMPROVEMENT: Every 6 hours ===
-    last_reflect = last_cycles.get("reflection", "2000-01-01T00:00:00")
-    hours_since_ref = (now - datetime.fromisoformat(last_reflect.replace("Z", "+00:00")
-                       if "Z" in last_reflect else last_reflect
-                       ).replace(tzinfo=timezone.utc)).total_seconds() / 3600
-    if hours_since_ref >= 5.5:
-        logger.info("🧠 Running self-improvement reflection...")
-        try:
-            await orchestrator.reflector.reflect()
-            last_cycles["reflection"] = now.isoformat()
-            tasks_run.append("reflection")
-        except Exception as e:
-            logger.error(f"Reflection failed: {e}")
-    
+            logger.error("%s failed: %s", name.capitalize(), e)
+            state.add_task_history(name, "error", repr(e)[:200])
+
     # Save cycle info
-    state.data["last_cycle_times"] = last_cycles
+    state.data["last_cycle_times"] = {
+        name: ts.isoformat() for name, ts in last_cycles.items()
+    }
     state.record_heartbeat()
     await state.save()
     
-    logger.info(f"✅ Cycle complete. Tasks run: {tasks_run}")
+    logger.info("✅ Cycle complete. Tasks run: %s", tasks_run)
     
     # Write summary for GitHub Actions
     summary_file = os.environ.get("GITHUB_STEP_SUMMARY", "")
@@ -164,7 +140,9 @@ async def run_cycle(orchestrator: "Orchestrator"):
 async def main():
     args = parse_args()
 
-    # Initialize
+    # Initialize. pydantic-settings only reads .env into declared fields;
+    # the API key lists come from os.environ, so load .env there first.
+    load_dotenv(override=False)
     settings = Settings()
     setup_logger(level="DEBUG" if args.verbose else settings.log_level)
     logger.info("=" * 60)
@@ -176,7 +154,23 @@ async def main():
     # Ensure state directory exists
     Path(settings.state_dir).mkdir(parents=True, exist_ok=True)
 
-    # Create orchestrator
+    # Health check endpoints for hosting platforms, served from this loop.
+    # Started before initialize() so platform health probes pass during
+    # the Gist fetch and provider setup; one-shot modes don't need them.
+    health_runner = None
+    if not (args.status or args.cycle or args.task):
+        from server import start_health_server, update_heartbeat
+
+        try:
+            health_runner = await start_health_server(settings.host, settings.port)
+            logger.info(f"Health server listening on {settings.host}:{settings.port}")
+        except OSError as e:
+            # A busy port must not take the agent down; run without health checks.
+            logger.warning(f"Health server failed to start on {settings.host}:{settings.port}: {e}")
+
+    # Create orchestrator (imported here so argument errors/--help stay fast)
+    from src.agents.orchestrator import Orchestrator
+
     orchestrator = Orchestrator(settings=settings, dry_run=args.dry_run)
     await orchestrator.initialize()
 
@@ -212,7 +206,11 @@ async def main():
         except NotImplementedError:
             signal.signal(sig, lambda s, f: signal_handler())
 
-    await orchestrator.run_forever(shutdown_event)
+    try:
+        await orchestrator.run_forever(shutdown_event, on_heartbeat=update_heartbeat)
+    finally:
+        if health_runner:
+            await health_runner.cleanup()
 
     logger.info("🦅 OpenCLAW-2 Literary Agent shut down gracefully.")
 
@@ -1,45 +1,72 @@
 """
 Health check server for cloud deployment (Render, Railway, etc.)
-Runs alongside the main agent loop to satisfy hosting platform requirements.
+Runs inside the main agent event loop to satisfy hosting platform requirements.
 """
 
-import asyncio
-import threading
-from fastapi import FastAPI
-from fastapi.responses import JSONResponse
-import uvicorn
 from datetime import datetime, timezone
 
-app = FastAPI(title="OpenCLAW Literary Agent", version="2.0.0")
+import orjson
+from aiohttp import web
 
-# Shared state for health reporting
+# Shared state for health reporting. Only touched from the agent's event loop.
 _agent_status = {"started_at": datetime.now(timezone.utc).isoformat(), "heartbeats": 0}
 
+# Pre-rendered response bodies; the payloads only change on heartbeat.
+_cached_root_bytes = b""
+_cached_health_bytes = b""
+_cached_status_bytes = b""
+
+
+def _render_bodies():
+    global _cached_root_bytes, _cached_health_bytes, _cached_status_bytes
+    _cached_root_bytes = orjson.dumps(
+        {"status": "running", "agent": "OpenCLAW Literary Agent v2.0", "info": _agent_status}
+    )
+    _cached_health_bytes = orjson.dumps(
+        {"healthy": True, "uptime_heartbeats": _agent_status["heartbeats"]}
+    )
+    _cached_status_bytes = orjson.dumps(_agent_status)
+
 
 def update_heartbeat():
     _agent_status["heartbeats"] += 1
     _agent_status["last_heartbeat"] = datetime.now(timezone.utc).isoformat()
+    _render_bodies()
+
+
+_render_bodies()
+
+
+async def root(request: web.Request) -> web.Response:
+    return web.Response(body=_cached_root_bytes, content_type="application/json")
+
 
+async def health(request: web.Request) -> web.Response:
+    return web.Response(body=_cached_health_bytes, content_type="application/json")
 
-@app.get("/")
-async def root():
-    return {"status": "running", "agent": "OpenCLAW Literary Agent v2.0", "info": _agent_status}
 
+async def status(request: web.Request) -> web.Response:
+    return web.Response(body=_cached_status_bytes, content_type="application/json")
 
-@app.get("/health")
-async def health():
-    return JSONResponse({"healthy": True, "uptime_heartbeats": _agent_status["heartbeats"]})
 
+def create_app() -> web.Application:
+    app = web.Application()
+    app.router.add_get("/", root)
+    app.router.add_get("/health", health)
+    app.router.add_get("/status", status)
+    return app
 
-@app.get("/status")
-async def status():
-    return _agent_status
 
+async def start_health_server(host: str = "0.0.0.0", port: int = 8000) -> web.AppRunner:
+    """Start the health check server on the running event loop.
 
-def start_health_server(host: str = "0.0.0.0", port: int = 8080):
-    """Start health check server in background thread."""
-    def run():
-        uvicorn.run(app, host=host, port=port, log_level="warning")
-    thread = threading.Thread(target=run, daemon=True)
-    thread.start()
-    return thread
+    Returns the runner; call ``await runner.cleanup()`` on shutdown.
+    """
+    runner = web.AppRunner(create_app(), access_log=None)
+    await runner.setup()
+    try:
+        await web.TCPSite(runner, host, port).start()
+    except OSError:
+        await runner.cleanup()
+        raise
+    return runner
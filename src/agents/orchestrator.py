@@ -6,7 +6,7 @@ Manages the 24/7 heartbeat loop, task scheduling, and agent coordination.
 import asyncio
 import random
 from datetime import datetime, timezone
-from typing import Dict, Optional
+from typing import Callable, Dict, Optional
 
 from config.settings import Settings
 from src.utils.llm_pool import LLMPool
@@ -147,9 +147,16 @@ class Orchestrator:
 
         await self.state.save()
 
-    async def run_forever(self, shutdown_event: asyncio.Event):
+    async def run_forever(
+        self,
+        shutdown_event: asyncio.Event,
+        on_heartbeat: Optional[Callable[[], None]] = None,
+    ):
         """
         Main 24/7 autonomous loop.
+
+        ``on_heartbeat`` is called after each heartbeat is recorded
+        (e.g. to update the health check server).
         
         Schedule:
         - Every 30 min: heartbeat + one task cycle
@@ -169,6 +176,8 @@ class Orchestrator:
 
                 logger.info(f"💓 Heartbeat #{self._heartbeat_count} at {now.isoformat()}")
                 self.state.record_heartbeat()
+                if on_heartbeat:
+                    on_heartbeat()
 
                 # Determine which tasks to run based on schedule
                 tasks_to_run = self._get_scheduled_tasks(hour)
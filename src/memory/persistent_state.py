@@ -36,12 +36,15 @@ class PersistentState:
             async with aiofiles.open(state_file, "r") as f:
                 self._state = json.loads(await f.read())
             logger.info(f"State loaded from disk: {len(self._state)} keys")
+            if self._migrate():
+                await self._save_local()
         elif self.github_pat and self.gist_id:
             # Try loading from Gist (ephemeral environment like GitHub Actions)
             logger.info("No local state found, loading from Gist...")
             loaded = await self._load_from_gist()
             if loaded:
                 logger.info(f"State loaded from Gist: {len(self._state)} keys")
+                self._migrate()
                 # Save locally for the rest of this session
                 await self._save_local()
             else:
@@ -53,6 +56,37 @@ class PersistentState:
             await self.save()
             logger.info("Fresh state initialized")
 
+    def _migrate(self) -> bool:
+        """Upgrade legacy state in place. Returns True if anything changed.
+
+        Older state files stored cycle times with a trailing ``Z`` or with no
+        offset at all; rewrite them as ``+00:00`` ISO strings so readers can
+        use ``datetime.fromisoformat`` directly. Unparseable entries are dropped.
+        """
+        last_cycles = self._state.get("last_cycle_times")
+        if not last_cycles:
+            return False
+        changed = False
+        for name, ts in list(last_cycles.items()):
+            try:
+                parsed = datetime.fromisoformat(ts.replace("Z", "+00:00"))
+            except (TypeError, ValueError, AttributeError):
+                # Unreadable timestamp: forget it so the task counts as due.
+                logger.warning(f"Dropping invalid last_cycle_times[{name!r}]: {ts!r}")
+                del last_cycles[name]
+                changed = True
+                continue
+            if parsed.tzinfo is None:
+                parsed = parsed.replace(tzinfo=timezone.utc)
+            normalized = parsed.astimezone(timezone.utc).isoformat()
+            if normalized != ts:
+                last_cycles[name] = normalized
+                changed = True
+        if changed:
+            logger.info("Migrated legacy last_cycle_times to UTC offsets")
+            self._dirty = True
+        return changed
+
     async def _load_from_gist(self) -> bool:
         """Try to load state from GitHub Gist."""
         try:
@@ -35,6 +35,18 @@ def test_author_profile():
     assert featured.genre
 
 
+def test_book_indexes():
+    """Verify title and keyword lookups over the catalog."""
+    from config.author_profile import ALL_BOOKS, get_book, books_with_keyword
+
+    assert get_book("Solie") is not None
+    assert get_book("Missing Title") is None
+    assert set(books_with_keyword("Drama")) == {
+        b for b in ALL_BOOKS if "drama" in b.keywords
+    }
+    assert books_with_keyword("no such keyword") == ()
+
+
 def test_provider_types():
     """Verify provider enum."""
     from src.utils.llm_pool import ProviderType
@@ -52,3 +64,132 @@ def test_settings_defaults():
     s = Settings()
     assert s.heartbeat_interval_minutes == 30
     assert s.author_name == "Francisco Angulo de Lafuente"
+
+
+def test_settings_key_lists_cached(monkeypatch):
+    """Verify key lists are parsed once and refreshed by reload_env()."""
+    from config.settings import Settings
+    monkeypatch.setenv("GROQ_API_KEYS", " a, ,b ")
+    Settings.reload_env()
+    s = Settings()
+    assert s.groq_api_keys == ("a", "b")
+
+    monkeypatch.setenv("GROQ_API_KEYS", "c")
+    assert s.groq_api_keys == ("a", "b")
+    Settings.reload_env()
+    assert s.groq_api_keys == ("c",)
+    Settings.reload_env()
+
+
+def test_run_cycle_respects_cooldowns(tmp_path):
+    """Verify run_cycle only runs tasks whose cooldown has elapsed."""
+    import json
+    from datetime import datetime, timedelta, timezone
+    from main import run_cycle
+    from src.memory.persistent_state import PersistentState
+
+    recent = (datetime.now(timezone.utc) - timedelta(hours=1)).isoformat()
+    legacy = {"community": recent, "library": "2000-01-01T00:00:00Z", "submissions": "2000-01-01T00:00:00"}
+    (tmp_path / "agent_state.json").write_text(json.dumps({"last_cycle_times": legacy}))
+    state = PersistentState(str(tmp_path))
+    asyncio.run(state.load())
+    assert state.data["last_cycle_times"]["library"] == "2000-01-01T00:00:00+00:00"
+    assert state.data["last_cycle_times"]["submissions"] == "2000-01-01T00:00:00+00:00"
+
+    orchestrator = MagicMock()
+    orchestrator.state = state
+    orchestrator.reflector.reflect = AsyncMock()
+    orchestrator.agents = {
+        name: MagicMock(run_cycle=AsyncMock())
+        for name in ("marketing", "community", "submissions", "library")
+    }
+
+    asyncio.run(run_cycle(orchestrator))
+
+    orchestrator.agents["community"].run_cycle.assert_not_awaited()
+    for name in ("marketing", "submissions", "library"):
+        orchestrator.agents[name].run_cycle.assert_awaited_once()
+    orchestrator.reflector.reflect.assert_awaited_once()
+    assert state.data["last_cycle_times"]["community"] == recent
+
+
+def test_run_cycle_accepts_naive_timestamps(tmp_path):
+    """Verify run_cycle treats unmigrated naive timestamps as UTC."""
+    from datetime import datetime, timedelta, timezone
+    from main import run_cycle
+    from src.memory.persistent_state import PersistentState
+
+    state = PersistentState(str(tmp_path))
+    recent = (datetime.now(timezone.utc) - timedelta(hours=1)).replace(tzinfo=None)
+    state.data["last_cycle_times"] = {"community": recent.isoformat()}
+
+    orchestrator = MagicMock()
+    orchestrator.state = state
+    orchestrator.reflector.reflect = AsyncMock()
+    orchestrator.agents = {
+        name: MagicMock(run_cycle=AsyncMock())
+        for name in ("marketing", "community", "submissions", "library")
+    }
+
+    asyncio.run(run_cycle(orchestrator))
+
+    orchestrator.agents["community"].run_cycle.assert_not_awaited()
+    orchestrator.agents["marketing"].run_cycle.assert_awaited_once()
+
+
+def test_health_server_caches_bodies():
+    """Verify health endpoints serve cached JSON that refreshes on heartbeat."""
+    from aiohttp.test_utils import TestClient, TestServer
+    import server
+
+    async def fetch(client, path):
+        resp = await client.get(path)
+        assert resp.status == 200
+        assert resp.content_type == "application/json"
+        return await resp.read()
+
+    async def run():
+        async with TestClient(TestServer(server.create_app())) as client:
+            health_before = await fetch(client, "/health")
+            status_before = await fetch(client, "/status")
+            assert health_before == server._cached_health_bytes
+            server.update_heartbeat()
+            health_after = await fetch(client, "/health")
+            status_after = await fetch(client, "/status")
+        assert health_after != health_before
+        assert status_after != status_before
+        heartbeats = server._agent_status["heartbeats"]
+        assert b'"uptime_heartbeats":%d' % heartbeats in health_after
+
+    asyncio.run(run())
+
+
+def test_run_forever_calls_on_heartbeat():
+    """Verify run_forever invokes the on_heartbeat callback each heartbeat."""
+    from config.settings import Settings
+    from src.agents.orchestrator import Orchestrator
+
+    orchestrator = Orchestrator(settings=Settings())
+    orchestrator.state = MagicMock(save=AsyncMock())
+
+    async def run():
+        shutdown_event = asyncio.Event()
+        on_heartbeat = MagicMock(side_effect=shutdown_event.set)
+        await orchestrator.run_forever(shutdown_event, on_heartbeat=on_heartbeat)
+        return on_heartbeat
+
+    on_heartbeat = asyncio.run(run())
+    on_heartbeat.assert_called_once_with()
+    orchestrator.state.record_heartbeat.assert_called_once_with()
+
+
+def test_state_load_drops_invalid_cycle_times(tmp_path):
+    """Verify malformed last_cycle_times entries don't break load()."""
+    import json
+    from src.memory.persistent_state import PersistentState
+
+    legacy = {"community": "bad", "library": 123, "marketing": "2000-01-01T00:00:00Z"}
+    (tmp_path / "agent_state.json").write_text(json.dumps({"last_cycle_times": legacy}))
+    state = PersistentState(str(tmp_path))
+    asyncio.run(state.load())
+    assert state.data["last_cycle_times"] == {"marketing": "2000-01-01T00:00:00+00:00"}